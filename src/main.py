@@ -27,6 +27,8 @@ from generate_audio import TangoFluxModel, AudioldmModel
 from reverb import init_reverb, apply_reverb
 from delay import init_delay, apply_delay
 from distortion import apply_distortion
+# Playback
+from transport import LoopTransport
 
 
 #################################################################
@@ -46,7 +48,7 @@ class App:
         self.audio_npy = np.zeros((2,self.BLOCK_SIZE))
         self.processed_np = np.zeros((2,self.BLOCK_SIZE))
         
-        self.playback_pos = 0
+        self.transport = LoopTransport(channels=2, max_block=self.BLOCK_SIZE, xfade=int(0.01 * self.SAMPLE_RATE))
         
         self.audio_generated = False
         self.audio_playing = False
@@ -242,11 +244,9 @@ class App:
     
     # Update function: sets the y axis data to the current output block from the main loop
     def graph_update(self, i):
-        audio_np = np.mean(self.processed_np, axis=0)
-        start = self.playback_pos * self.BLOCK_SIZE
-        audio_block = audio_np[start : start + self.BLOCK_SIZE]
+        audio_block = self.transport.last_block
         if audio_block.shape[0] == self.BLOCK_SIZE:
-            self.g1.set_ydata(audio_block)
+            self.g1.set_ydata(np.mean(audio_block, axis=1))
         return (self.g1,)
 
     ###########
@@ -290,7 +290,6 @@ class App:
         """Handle successful audio generation"""
         #self.update_chat(f"Generated audio for: '{prompt}'")
         self.status_label.config(text="Playing audio...")
-        self.playback_pos = 0  # Start from the beginning
         #self.setup_reverb_effect()               
         #self.play_audio_async()
         # Enable save button
@@ -298,8 +297,9 @@ class App:
         #self.current_audio = audio  # Store for saving
         self.send_button.config(state=Tk.NORMAL)
         self.audio_effect_chain()
+        self.transport.set_loop(0, None)
+        self.transport.seek(0)  # Start from the beginning
         self.audio_generated = True
-        self.num_samples = self.audio_npy.shape[1] // self.BLOCK_SIZE
         self.on_play()
         
     def audio_effect_chain(self):
@@ -308,7 +308,8 @@ class App:
             Distortion(drive_db=self.distortion_dial.get()),
             Delay(delay_seconds=0.2, feedback=self.delay_dial.get(), mix=0.3),
         ])
-        self.processed_np = board(self.audio_npy, self.SAMPLE_RATE)                
+        self.processed_np = board(self.audio_npy, self.SAMPLE_RATE)
+        self.transport.set_audio(self.processed_np)
 
     def on_play(self):
         if self.audio_playing == False:
@@ -398,11 +399,11 @@ if __name__ == "__main__":
                 app.audio_effect_chain()
                 app.dial_updated = False
             
-            audio_np = app.processed_np
-            start = app.playback_pos * app.BLOCK_SIZE
-            audio_block = audio_np[:, start : start + app.BLOCK_SIZE]
-            stream.write(audio_block.tobytes())
-            app.playback_pos = (app.playback_pos + 1) if app.playback_pos < app.num_samples else 0
+            # Interleaved float32 frames, rendered in place by the transport.
+            # The contiguous buffer is handed to PortAudio directly (no bytes copy);
+            # num_frames must be explicit since len() of an ndarray is its row count.
+            audio_block = app.transport.read(app.BLOCK_SIZE)
+            stream.write(audio_block, num_frames=app.BLOCK_SIZE)
             last_frame_time = int(round(time.time() * 1000))
     
     print("Cleaning up resources...")
@@ -0,0 +1,4 @@
+# src/ modules import each other as top-level modules (as when running src/main.py)
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,97 @@
+# Tests for the looping transport in src/transport.py
+
+import numpy as np
+import pytest
+
+from transport import LoopTransport
+
+
+def ramp_clip(num_frames: int = 1000) -> np.ndarray:
+    """Stereo clip whose left channel holds the frame index, right channel its negative"""
+    x = np.arange(num_frames, dtype=np.float32)
+    return np.vstack([x, -x])
+
+def render(transport: LoopTransport, total: int, block: int) -> np.ndarray:
+    out = []
+    while total > 0:
+        n = min(block, total)
+        out.append(transport.read(n).copy())
+        total -= n
+    return np.concatenate(out)
+
+
+def test_output_independent_of_block_size():
+    clip = np.random.default_rng(0).uniform(-1, 1, (2, 20000)).astype(np.float32)
+    blocks = []
+    for block in (37, 4410):
+        t = LoopTransport(xfade=441)
+        t.set_audio(clip)
+        t.set_loop(1234, 17890)
+        blocks.append(render(t, 50000, block))
+    np.testing.assert_array_equal(blocks[0], blocks[1])
+
+def test_plays_whole_clip_then_wraps_sample_accurately():
+    t = LoopTransport(xfade=0)
+    t.set_audio(ramp_clip(1000))
+    out = render(t, 2500, 37)
+    np.testing.assert_array_equal(out[:, 0], np.arange(2500) % 1000)
+    np.testing.assert_array_equal(out[:, 1], -out[:, 0])
+
+def test_seam_jumps_from_loop_out_to_loop_in_plus_xfade():
+    t = LoopTransport(xfade=8)
+    t.set_audio(ramp_clip(1000))
+    t.set_loop(100, 500)
+    t.seek(480)
+    out = t.read(40)[:, 0]
+    # Untouched audio up to the crossfade, blended seam, then continuation after the head
+    np.testing.assert_array_equal(out[:12], np.arange(480, 492))
+    w = 0.5 * np.pi * (np.arange(8) + 0.5) / 8
+    np.testing.assert_allclose(out[12:20], np.arange(492, 500) * np.cos(w) + np.arange(100, 108) * np.sin(w), rtol=1e-6)
+    np.testing.assert_array_equal(out[20:], np.arange(108, 128))
+    assert t.position == 128
+
+def test_equal_gain_curve_does_not_exceed_correlated_input():
+    x = np.sin(2 * np.pi * 440 * np.arange(44100) / 44100).astype(np.float32)
+    clip = np.vstack([x, x])
+    peaks = {}
+    for curve in ("power", "gain"):
+        t = LoopTransport(xfade=441, curve=curve)
+        t.set_audio(clip)
+        t.set_loop(1000, 30000)
+        peaks[curve] = np.abs(render(t, 100000, 4410)).max()
+    assert peaks["power"] > 1.0
+    assert peaks["gain"] <= 1.0 + 1e-6
+
+def test_unknown_curve_raises():
+    with pytest.raises(ValueError):
+        LoopTransport(curve="linear")
+
+def test_seek_clamps_to_loop_range():
+    t = LoopTransport()
+    t.set_audio(ramp_clip(1000))
+    t.set_loop(100, 500)
+    t.seek(-10)
+    assert t.position == 0
+    t.seek(10000)
+    assert t.position == 499
+    t.seek(250)
+    assert t.read(1)[0, 0] == 250
+
+def test_empty_clip_outputs_silence():
+    t = LoopTransport(max_block=16)
+    t.set_loop(5, None)
+    assert (t.loop_in, t.loop_out) == (0, 0)
+    t.seek(100)
+    assert t.position == 0
+    out = t.read(16)
+    assert out.shape == (16, 2)
+    assert not out.any()
+
+def test_buffer_grows_when_block_exceeds_max_block():
+    t = LoopTransport(max_block=16, xfade=0)
+    t.set_audio(ramp_clip(1000))
+    out = t.read(100)
+    assert out.shape == (100, 2)
+    assert t.out.shape[0] >= 100
+    np.testing.assert_array_equal(out[:, 0], np.arange(100))
+    assert out.dtype == np.float32 and out.flags["C_CONTIGUOUS"]